@@ -11,16 +11,28 @@ License: MIT
 import customtkinter as ctk
 import subprocess
 import threading
+import queue
+import io
+import collections
+import itertools
+import asyncio
+import concurrent.futures
+import codecs
+import fcntl
 import os
 import re
+import shlex
+import signal
+import stat
 import time
 import logging
 import json
 import webbrowser
+import types
+from operator import attrgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Optional, Dict, List, Iterator
 from utils import (
     get_rclone_path, 
     ensure_executable, 
@@ -30,10 +42,25 @@ from utils import (
     save_sync_profile,
     load_sync_profiles,
     delete_sync_profile,
+    load_last_profile_name,
+    save_last_profile_name,
     get_app_version
 )
 
 
+APP_VERSION = get_app_version()
+
+_REMOTE_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*:[/a-zA-Z0-9_.-]*$')
+
+# Fixed flags that follow the endpoints of each rclone command
+_BISYNC_FLAGS = ("--create-empty-src-dirs", "--resilient", "-v")
+_RESYNC_FLAGS = ("--resync", *_BISYNC_FLAGS)
+_COPY_FLAGS = ("-v",)
+
+# Additional flags that rclone bisync rejects
+_BISYNC_DENY = frozenset({"--compare", "--slow-hash-sync-only"})
+
+
 class LinuxCloudSync(ctk.CTk):
     """Main application window for LinuxCloud Sync."""
     
@@ -42,11 +69,33 @@ class LinuxCloudSync(ctk.CTk):
     WINDOW_HEIGHT = 700
     COMMAND_TIMEOUT = 10
     SYNC_TIMEOUT = 3600  # 1 hour
-    VERSION = get_app_version()
+    OUTPUT_READ_SIZE = 65536
+    PIPE_BUFFER_SIZE = 1024 * 1024
+    WORKER_COUNT = 2
+    LOG_MAX_LINES = 5000
+    LOG_DROP_LINES = 1000
+    LOG_FLUSH_THRESHOLD = 64 * 1024
+    LOG_DRAIN_INTERVAL = 50  # ms
+    LOG_DRAIN_BATCH = 200
+    ASYNCIO_TICK_INTERVAL = 10  # ms
+    VERSION = APP_VERSION
     
     def __init__(self):
         super().__init__()
         
+        # Shared fonts, built once now that the Tk root exists
+        self._fonts = {
+            "h1": ctk.CTkFont(size=24, weight="bold"),
+            "title": ctk.CTkFont(size=20, weight="bold"),
+            "h2": ctk.CTkFont(size=16, weight="bold"),
+            "h3": ctk.CTkFont(size=14, weight="bold"),
+            "body": ctk.CTkFont(size=14),
+            "label": ctk.CTkFont(size=12, weight="bold"),
+            "code": ctk.CTkFont(size=12),
+            "link": ctk.CTkFont(size=12, underline=True),
+            "small": ctk.CTkFont(size=11),
+        }
+        
         # Setup logging
         self.logger = setup_logging()
         self.logger.info(f"LinuxCloudSync v{self.VERSION} starting...")
@@ -62,8 +111,12 @@ class LinuxCloudSync(ctk.CTk):
         # Initialize rclone path
         self.rclone_path = get_rclone_path()
         self.rclone_config = get_rclone_config_path()
+        self._rclone_env = types.MappingProxyType(
+            {**os.environ, 'RCLONE_CONFIG': self.rclone_config}
+        )
         self.bisync_workdir = str(get_config_dir() / "bisync")
         Path(self.bisync_workdir).mkdir(parents=True, exist_ok=True)
+        self._safe_bases: tuple[str, ...] = (str(Path.home()), '/mnt', '/media', '/tmp/linuxcloudsync')
         
         # Ensure rclone is executable
         try:
@@ -76,48 +129,99 @@ class LinuxCloudSync(ctk.CTk):
             return
         
         # State variables
-        self.sync_process: Optional[subprocess.Popen] = None
         self.is_syncing: bool = False
         self.sync_start_time: float = 0
         self.sync_profiles: Dict = {}
         self.current_profile: Optional[str] = None
+        # Last used profile as read at startup and written since
+        self._last_profile: Optional[str] = None
+        # Profile rows currently shown: name -> (row frame, remote label, local label)
+        self._profile_widgets: Dict[str, tuple] = {}
+        self._profiles_empty_label: Optional[ctk.CTkLabel] = None
+        
+        # ("log", line) and ("progress", value) records produced off the Tk
+        # thread, drained on the Tk thread
+        self._log_queue: collections.deque = collections.deque()
+        self._log_drain_active: bool = False
+        self._last_ts_sec: int = 0
+        self._last_ts_str: str = ""
+        self._log_staging = io.StringIO()
+        self._log_flush_scheduled: bool = False
+        
+        # Long-lived workers for blocking rclone jobs
+        self._jobq: queue.Queue = queue.Queue()
+        for i in range(self.WORKER_COUNT):
+            threading.Thread(
+                target=self._worker_loop,
+                name=f"lcs-worker-{i}",
+                daemon=True
+            ).start()
+        
+        # Single worker for profile file I/O, so writes land in submit order
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="lcs-io"
+        )
+        
+        # Event loop that streams subprocess output, stepped from Tk's
+        # mainloop so coroutines run on the Tk thread
+        self._loop = asyncio.new_event_loop()
+        self._loop_tick_active: bool = False
+        # Python 3.9 binds asyncio primitives to the current loop when they
+        # are created, so make ours current before building the stop event
+        asyncio.set_event_loop(self._loop)
+        # Set by Stop Sync; wakes the running sync coroutine immediately
+        self._stop_event = asyncio.Event()
         
         # Advanced options
         self.bandwidth_limit: str = ""
-        self.exclude_patterns: List[str] = []
         self.dry_run: bool = False
         
-        # Load saved profiles
-        self.sync_profiles = load_sync_profiles()
-        
         # Build UI
         self.create_widgets()
         
         # Check rclone version on startup
         self.check_rclone_version()
         
-        # Load last used profile if exists
-        self.load_last_profile()
+        # Load saved profiles, then the last used one if it exists
+        self._submit_io(
+            lambda: (load_sync_profiles(), load_last_profile_name()),
+            callback=self._on_profiles_loaded
+        )
+
+    def _submit_io(self, func, *args, callback):
+        """Run func on the profile I/O worker and pass its result to callback on the Tk thread."""
+        future = self._io_executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.after_idle(callback, f.result()))
+
+    def _worker_loop(self):
+        """Run queued background jobs for the lifetime of the app."""
+        while True:
+            job = self._jobq.get()
+            try:
+                job()
+            except Exception as e:
+                self.logger.error(f"Background job failed: {e}")
 
-    def _get_bisync_lock_files(self) -> List[Path]:
-        """Return any bisync lock files in the workdir."""
+    def _iter_bisync_lock_files(self) -> Iterator[Path]:
+        """Yield any bisync lock files in the workdir, in directory order."""
         try:
-            workdir = Path(self.bisync_workdir)
-            if not workdir.exists():
-                return []
-            return sorted(workdir.glob("*.lck"))
-        except Exception:
-            return []
+            with os.scandir(self.bisync_workdir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".lck") and entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+        except OSError:
+            return
 
     def _maybe_clear_bisync_locks(self) -> None:
         """Offer to clear stale bisync lock files."""
-        lock_files = self._get_bisync_lock_files()
-        if not lock_files:
-            return
         if self.is_syncing:
             return
+        lock_files = list(self._iter_bisync_lock_files())
+        if not lock_files:
+            return
 
-        lock_list = "\n".join(str(p) for p in lock_files)
+        lock_list = "\n".join(str(p) for p in sorted(lock_files, key=attrgetter("name")))
         confirm = messagebox.askyesno(
             "Stale Bisync Lock Detected",
             "One or more bisync lock files were found. This can happen if a prior\n"
@@ -150,14 +254,14 @@ class LinuxCloudSync(ctk.CTk):
         title_label = ctk.CTkLabel(
             header_frame,
             text=f"☁️ LinuxCloud Sync v{self.VERSION}",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._fonts["h1"]
         )
         title_label.pack(side="left")
         
         self.status_indicator = ctk.CTkLabel(
             header_frame,
             text="● Ready",
-            font=ctk.CTkFont(size=14),
+            font=self._fonts["body"],
             text_color="#4ade80"
         )
         self.status_indicator.pack(side="right")
@@ -189,7 +293,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             connection_frame,
             text="Cloud Storage Connection",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["h2"]
         ).pack(anchor="w", padx=20, pady=(10, 5))
         
         button_frame = ctk.CTkFrame(connection_frame, fg_color="transparent")
@@ -236,7 +340,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             sync_frame,
             text="Sync Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["h2"]
         ).pack(anchor="w", padx=20, pady=(10, 5))
         
         # Remote selector
@@ -320,7 +424,7 @@ class LinuxCloudSync(ctk.CTk):
         log_label = ctk.CTkLabel(
             sync_frame,
             text="Output Log:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._fonts["h3"]
         )
         log_label.pack(anchor="w", padx=20, pady=(10, 5))
         
@@ -334,7 +438,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             profiles_tab,
             text="Sync Profiles",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["h2"]
         ).pack(anchor="w", padx=20, pady=(20, 10))
         
         # Profiles list
@@ -361,7 +465,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             advanced_tab,
             text="Advanced Options",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._fonts["h2"]
         ).pack(anchor="w", padx=20, pady=(20, 10))
         
         options_frame = ctk.CTkFrame(advanced_tab)
@@ -416,7 +520,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             options_frame,
             text="Additional rclone flags:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._fonts["label"]
         ).pack(anchor="w", padx=20, pady=(20, 5))
         
         self.additional_flags_entry = ctk.CTkEntry(
@@ -436,7 +540,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             about_frame,
             text=f"LinuxCloud Sync v{self.VERSION}",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._fonts["title"]
         ).pack(pady=10)
         
         # Description
@@ -474,7 +578,7 @@ class LinuxCloudSync(ctk.CTk):
         ctk.CTkLabel(
             about_frame,
             text=about_text,
-            font=ctk.CTkFont(size=12),
+            font=self._fonts["code"],
             justify="left"
         ).pack(pady=10, padx=20)
 
@@ -483,7 +587,7 @@ class LinuxCloudSync(ctk.CTk):
         github_label = ctk.CTkLabel(
             about_frame,
             text=github_url,
-            font=ctk.CTkFont(size=12, underline=True),
+            font=self._fonts["link"],
             text_color="#38bdf8",
             cursor="hand2"
         )
@@ -516,18 +620,25 @@ class LinuxCloudSync(ctk.CTk):
             width=180
         ).pack(side="left", padx=10)
     
+    def _timestamp(self) -> str:
+        """Return the current HH:MM:SS, reformatted only when the second changes."""
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._last_ts_sec = sec
+        return self._last_ts_str
+    
     def log(self, message: str, level: str = "INFO"):
         """Add a message to the log output."""
-        try:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            formatted_msg = f"[{timestamp}] {message}"
-            
-            self.log_text.configure(state="normal")
-            self.log_text.insert("end", f"{formatted_msg}\n")
-            self.log_text.see("end")
-            self.log_text.configure(state="disabled")
-        except Exception as e:
-            self.logger.error(f"Error writing to log widget: {e}")
+        # Keep queued worker output ahead of this message
+        self._collect_log_queue()
+        
+        self._log_staging.write(f"[{self._timestamp()}] {message}\n")
+        if self._log_staging.tell() >= self.LOG_FLUSH_THRESHOLD:
+            self._flush_log()
+        elif not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(50, self._flush_log)
         
         # Also log to file
         if level == "ERROR":
@@ -537,6 +648,172 @@ class LinuxCloudSync(ctk.CTk):
         else:
             self.logger.info(message)
     
+    def _flush_log(self):
+        """Write staged log lines to the log widget in one batch."""
+        self._log_flush_scheduled = False
+        if not self._log_staging.tell():
+            return
+        
+        text = self._log_staging.getvalue()
+        self._log_staging = io.StringIO()
+        try:
+            # While syncing the widget is left writable (see _set_log_writable)
+            if not self.is_syncing:
+                self.log_text.configure(state="normal")
+            self.log_text.insert("end", text)
+            # Past LOG_MAX_LINES, drop at least LOG_DROP_LINES of the
+            # oldest lines so trimming happens once per thousand lines
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            excess = line_count - self.LOG_MAX_LINES
+            if excess > 0:
+                drop = max(excess, self.LOG_DROP_LINES)
+                self.log_text.delete("1.0", f"{drop + 1}.0")
+            self.log_text.see("end")
+            if not self.is_syncing:
+                self.log_text.configure(state="disabled")
+        except Exception as e:
+            self.logger.error(f"Error writing to log widget: {e}")
+    
+    def _set_log_writable(self, writable: bool):
+        """Toggle the log widget state once per sync instead of per write."""
+        self.log_text.configure(state="normal" if writable else "disabled")
+    
+    def _start_log_drain(self):
+        """Start polling the worker output queue if it is not running."""
+        if not self._log_drain_active:
+            self._log_drain_active = True
+            self.after(self.LOG_DRAIN_INTERVAL, self._drain_log_queue)
+    
+    def _drain_log_queue(self):
+        """Flush a batch of queued worker output while a sync is producing it."""
+        self._collect_log_queue(self.LOG_DRAIN_BATCH)
+        self._flush_log()
+        if self.is_syncing or self._log_queue:
+            self.after(self.LOG_DRAIN_INTERVAL, self._drain_log_queue)
+        else:
+            self._log_drain_active = False
+    
+    def _collect_log_queue(self, limit: Optional[int] = None):
+        """Apply up to limit queued worker records.
+        
+        Log lines go to the staging buffer; progress updates are coalesced
+        so the bar is set at most once per batch.
+        """
+        records = []
+        try:
+            while limit is None or len(records) < limit:
+                records.append(self._log_queue.popleft())
+        except IndexError:
+            pass
+        
+        if not records:
+            return
+        
+        timestamp = self._timestamp()
+        last_progress = None
+        for kind, value in records:
+            if kind == "log":
+                self._log_staging.write(f"[{timestamp}] {value}\n")
+                self.logger.info(value)
+            elif kind == "progress":
+                last_progress = value
+        
+        if last_progress is not None and last_progress != self.progress_bar.get():
+            self.progress_bar.set(last_progress)
+    
+    async def _spawn_rclone(self, cmd: List[str]):
+        """Start rclone with its combined output on an enlarged pipe.
+        
+        Returns the process and a StreamReader for stdout/stderr.
+        """
+        read_fd, write_fd = os.pipe()
+        if hasattr(fcntl, "F_SETPIPE_SZ"):
+            try:
+                # Let verbose rclone output queue up in the kernel so each
+                # wakeup drains more of it in one read.
+                fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, self.PIPE_BUFFER_SIZE)
+            except OSError:
+                pass  # above /proc/sys/fs/pipe-max-size; keep the default
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.STDOUT,
+                env=self._rclone_env,
+                start_new_session=True
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        
+        reader = asyncio.StreamReader()
+        await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(read_fd, 'rb', buffering=0)
+        )
+        return proc, reader
+    
+    async def _aiter_output_lines(self, stream: asyncio.StreamReader):
+        """Yield output lines from a subprocess stream as they arrive."""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ""
+        
+        while chunk := await stream.read(self.OUTPUT_READ_SIZE):
+            # Decode the whole chunk at once; the incremental decoder
+            # carries any multi-byte sequence split across reads.
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                yield line
+        
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+    
+    async def _stream_to_log(self, proc, output: asyncio.StreamReader, timeout: float) -> str:
+        """Queue output lines until the process exits, Stop is pressed or timeout.
+        
+        Returns "done", "stopped" or "timeout". In the last two cases the
+        process is terminated before returning.
+        """
+        async def pump():
+            async for line in self._aiter_output_lines(output):
+                line_clean = line.rstrip()
+                if line_clean:
+                    self._log_queue.append(("log", line_clean))
+                    
+                    # Update progress bar based on output
+                    if line_clean.startswith("Transferred:"):
+                        self._log_queue.append(("progress", 0.7))
+        
+        reader = asyncio.ensure_future(pump())
+        stopper = asyncio.ensure_future(self._stop_event.wait())
+        done, _ = await asyncio.wait(
+            {reader, stopper},
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        stopper.cancel()
+        if reader in done:
+            reader.result()
+            return "done"
+        
+        reader.cancel()
+        await self._terminate_process(proc)
+        # Drain what is left so the pipe transport sees EOF and closes
+        try:
+            await asyncio.wait_for(output.read(), timeout=5)
+        except Exception:
+            pass
+        if stopper in done and not stopper.cancelled():
+            # Only a set event means Stop; re-raise if the waiter itself failed
+            if stopper.exception() is not None:
+                raise stopper.exception()
+            return "stopped"
+        return "timeout"
+    
     def check_rclone_version(self):
         """Verify rclone is working and display version."""
         try:
@@ -560,24 +837,22 @@ class LinuxCloudSync(ctk.CTk):
     
     def validate_remote_name(self, remote: str) -> bool:
         """Validate remote name format for security."""
-        pattern = r'^[a-zA-Z0-9][a-zA-Z0-9_-]*:[/a-zA-Z0-9_.-]*$'
-        return bool(re.match(pattern, remote))
+        return _REMOTE_RE.match(remote) is not None
     
     def validate_local_path(self, path: str) -> tuple[bool, str]:
         """Validate local path for security."""
         try:
             abs_path = os.path.abspath(path)
             
-            if not Path(abs_path).exists():
+            try:
+                st = os.stat(abs_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return False, "Path does not exist"
             
-            safe_bases = [str(Path.home()), '/mnt', '/media', '/tmp/linuxcloudsync']
-            is_safe = any(abs_path.startswith(base) for base in safe_bases)
-            
-            if not is_safe:
+            if not abs_path.startswith(self._safe_bases):
                 return False, "Path must be within home directory, /mnt, or /media"
             
-            if not Path(abs_path).is_dir():
+            if not stat.S_ISDIR(st.st_mode):
                 return False, "Path must be a directory"
             
             return True, abs_path
@@ -592,27 +867,24 @@ class LinuxCloudSync(ctk.CTk):
         
         def run_config():
             try:
-                env = os.environ.copy()
-                env['RCLONE_CONFIG'] = self.rclone_config
-                
                 result = subprocess.run(
                     [self.rclone_path, "config", "create", "gdrive", "drive"],
-                    env=env,
+                    env=self._rclone_env,
                     timeout=300
                 )
                 
                 if result.returncode == 0:
-                    self.after(0, lambda: self.log("✓ Google Drive configuration completed"))
-                    self.after(0, lambda: self.list_remotes())
+                    self.after_idle(self.log, "✓ Google Drive configuration completed")
+                    self.after_idle(self.list_remotes)
                 else:
-                    self.after(0, lambda: self.log("❌ Configuration failed or cancelled", "WARNING"))
+                    self.after_idle(self.log, "❌ Configuration failed or cancelled", "WARNING")
                     
             except subprocess.TimeoutExpired:
-                self.after(0, lambda: self.log("❌ Configuration timeout (5 minutes)", "ERROR"))
+                self.after_idle(self.log, "❌ Configuration timeout (5 minutes)", "ERROR")
             except Exception as e:
-                self.after(0, lambda: self.log(f"❌ Configuration error: {str(e)}", "ERROR"))
+                self.after_idle(self.log, f"❌ Configuration error: {e}", "ERROR")
         
-        threading.Thread(target=run_config, daemon=True).start()
+        self._jobq.put(run_config)
     
     def connect_onedrive(self):
         """Launch rclone config for OneDrive setup."""
@@ -621,41 +893,35 @@ class LinuxCloudSync(ctk.CTk):
         
         def run_config():
             try:
-                env = os.environ.copy()
-                env['RCLONE_CONFIG'] = self.rclone_config
-                
                 result = subprocess.run(
                     [self.rclone_path, "config", "create", "onedrive", "onedrive"],
-                    env=env,
+                    env=self._rclone_env,
                     timeout=300
                 )
                 
                 if result.returncode == 0:
-                    self.after(0, lambda: self.log("✓ OneDrive configuration completed"))
-                    self.after(0, lambda: self.list_remotes())
+                    self.after_idle(self.log, "✓ OneDrive configuration completed")
+                    self.after_idle(self.list_remotes)
                 else:
-                    self.after(0, lambda: self.log("❌ Configuration failed or cancelled", "WARNING"))
+                    self.after_idle(self.log, "❌ Configuration failed or cancelled", "WARNING")
                     
             except subprocess.TimeoutExpired:
-                self.after(0, lambda: self.log("❌ Configuration timeout (5 minutes)", "ERROR"))
+                self.after_idle(self.log, "❌ Configuration timeout (5 minutes)", "ERROR")
             except Exception as e:
-                self.after(0, lambda: self.log(f"❌ Configuration error: {str(e)}", "ERROR"))
+                self.after_idle(self.log, f"❌ Configuration error: {e}", "ERROR")
         
-        threading.Thread(target=run_config, daemon=True).start()
+        self._jobq.put(run_config)
     
     def list_remotes(self):
         """List all configured remotes."""
         try:
-            env = os.environ.copy()
-            env['RCLONE_CONFIG'] = self.rclone_config
-            
             result = subprocess.run(
                 [self.rclone_path, "listremotes"],
                 capture_output=True,
                 text=True,
                 encoding='utf-8',
                 errors='replace',
-                env=env,
+                env=self._rclone_env,
                 timeout=self.COMMAND_TIMEOUT
             )
             
@@ -711,90 +977,51 @@ class LinuxCloudSync(ctk.CTk):
         self.stop_btn.configure(state="normal")
         self.status_indicator.configure(text="● Resyncing", text_color="#f59e0b")
         self.progress_bar.set(0.1)
+        self._set_log_writable(True)
+        self._start_log_drain()
 
-        def run_resync():
-            process_stdout = None
-            proc = None
-            try:
-                env = os.environ.copy()
-                env['RCLONE_CONFIG'] = self.rclone_config
-
-                cmd = [
-                    self.rclone_path,
-                    "bisync",
-                    remote,
-                    local_path,
-                    "--workdir",
-                    self.bisync_workdir,
-                    "--resync",
-                    "--create-empty-src-dirs",
-                    "--resilient",
-                    "-v"
-                ]
-
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    env=env,
-                    bufsize=1
-                )
-                self.sync_process = proc
-
-                if not self.is_syncing:
-                    self.after(0, lambda: self.log("⏹ Resync stopped by user"))
-                    self._terminate_sync_process()
-                    return
-
-                process_stdout = proc.stdout
-                timeout_time = time.time() + 300
-                for line in iter(proc.stdout.readline, ''):
-                    if not self.is_syncing:
-                        self.after(0, lambda: self.log("⏹ Resync stopped by user"))
-                        self._terminate_sync_process()
-                        break
-                    if time.time() > timeout_time:
-                        self.after(0, lambda: self.log("⏱️ Resync timeout (5 min)", "WARNING"))
-                        self.is_syncing = False
-                        break
-                    line_clean = line.rstrip()
-                    if line_clean:
-                        self.after(0, lambda msg=line_clean: self.log(msg))
+        self._submit_sync_job(self._resync_coro(remote, local_path))
+    
+    async def _resync_coro(self, remote: str, local_path: str):
+        """Run bisync --resync and stream its output into the log."""
+        try:
+            cmd = [self.rclone_path, "bisync", remote, local_path,
+                   "--workdir", self.bisync_workdir, *_RESYNC_FLAGS]
 
-                proc.wait(timeout=10)
+            proc, output = await self._spawn_rclone(cmd)
 
-                if self.is_syncing:
-                    if proc.returncode == 0:
-                        self.after(0, lambda: self.log("✓ Resync completed successfully"))
-                        self.after(0, lambda: self.log("   You can now run normal sync"))
-                    else:
-                        self.after(0, lambda: self.log(f"⚠ Resync exit code: {proc.returncode}", "WARNING"))
+            if self._stop_event.is_set():
+                self.log("⏹ Resync stopped by user")
+                await self._terminate_process(proc)
+                return
 
-            except subprocess.TimeoutExpired:
-                self.after(0, lambda: self.log("❌ Resync timeout", "ERROR"))
-            except Exception as e:
-                self.after(0, lambda err=str(e): self.log(f"❌ Resync error: {err}", "ERROR"))
-            finally:
-                if process_stdout:
-                    try:
-                        process_stdout.close()
-                    except Exception:
-                        pass
-                self.sync_process = None
+            outcome = await self._stream_to_log(proc, output, timeout=300)
+            if outcome == "timeout":
+                self.log("⏱️ Resync timeout (5 min)", "WARNING")
+                self.is_syncing = False
+            elif outcome == "stopped":
+                self.log("⏹ Resync stopped by user")
 
-                def reset_ui():
-                    self.is_syncing = False
-                    self.sync_btn.configure(state="normal")
-                    self.stop_btn.configure(state="disabled")
-                    self.status_indicator.configure(text="● Ready", text_color="#4ade80")
-                    self.progress_bar.set(0)
+            await asyncio.wait_for(proc.wait(), timeout=10)
 
-                self.after(0, reset_ui)
+            if outcome == "done":
+                if proc.returncode == 0:
+                    self.log("✓ Resync completed successfully")
+                    self.log("   You can now run normal sync")
+                else:
+                    self.log(f"⚠ Resync exit code: {proc.returncode}", "WARNING")
 
-        threading.Thread(target=run_resync, daemon=True).start()
+        except asyncio.TimeoutError:
+            self.log("❌ Resync timeout", "ERROR")
+        except Exception as e:
+            self.log(f"❌ Resync error: {e}", "ERROR")
+        finally:
+            self.is_syncing = False
+            self.sync_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+            self.status_indicator.configure(text="● Ready", text_color="#4ade80")
+            self.progress_bar.set(0)
+            self._set_log_writable(False)
     
     def browse_folder(self):
         """Open folder browser dialog."""
@@ -827,17 +1054,50 @@ class LinuxCloudSync(ctk.CTk):
         else:
             self.log("ℹ Dry run mode disabled")
 
-    def _terminate_sync_process(self):
-        """Terminate the running rclone process if it exists."""
-        if not self.sync_process:
+    def _build_exclude_flags(self) -> List[str]:
+        """Build --exclude flags from the exclude patterns box."""
+        text = self.exclude_text.get("1.0", "end")
+        patterns = [
+            pattern
+            for pattern in map(str.strip, text.splitlines())
+            if pattern and not pattern.startswith('#')
+        ]
+        return list(itertools.chain.from_iterable(
+            ("--exclude", pattern) for pattern in patterns
+        ))
+
+    def _submit_sync_job(self, coro):
+        """Run a sync coroutine on the event loop with a cleared stop request."""
+        self._stop_event.clear()
+        self._loop.create_task(coro)
+        if not self._loop_tick_active:
+            self._loop_tick_active = True
+            self.after_idle(self._tick_asyncio)
+    
+    def _tick_asyncio(self):
+        """Run one pass of the event loop; keep ticking while tasks remain."""
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        if asyncio.all_tasks(self._loop):
+            self.after(self.ASYNCIO_TICK_INTERVAL, self._tick_asyncio)
+        else:
+            self._loop_tick_active = False
+    
+    async def _terminate_process(self, proc: asyncio.subprocess.Process):
+        """Terminate rclone and its process group, killing them if needed.
+        
+        rclone is started in its own session, so signalling the group also
+        reaches any helpers it spawned.
+        """
+        if proc.returncode is not None:
             return
         try:
-            self.sync_process.terminate()
+            os.killpg(proc.pid, signal.SIGTERM)
             try:
-                self.sync_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.sync_process.kill()
-                self.sync_process.wait()
+                await asyncio.wait_for(proc.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                os.killpg(proc.pid, signal.SIGKILL)
+                await asyncio.wait_for(proc.wait(), timeout=3)
         except Exception:
             pass
     
@@ -873,6 +1133,15 @@ class LinuxCloudSync(ctk.CTk):
         
         local_path = result
         
+        try:
+            extra_flags = shlex.split(self.additional_flags_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Invalid Flags", f"Could not parse additional flags:\n{e}")
+            return
+        
+        if "Bidirectional" in self.sync_mode.get():
+            self._maybe_clear_bisync_locks()
+        
         # Update UI state
         self.is_syncing = True
         self.sync_start_time = time.time()
@@ -880,6 +1149,8 @@ class LinuxCloudSync(ctk.CTk):
         self.stop_btn.configure(state="normal")
         self.status_indicator.configure(text="● Syncing", text_color="#f59e0b")
         self.progress_bar.set(0.1)
+        self._set_log_writable(True)
+        self._start_log_drain()
         
         sync_mode = self.sync_mode.get()
         self.log(f"🔄 Starting sync ({sync_mode})")
@@ -889,164 +1160,111 @@ class LinuxCloudSync(ctk.CTk):
         if self.dry_run:
             self.log("   ⚠ DRY RUN MODE - No changes will be made")
         
-        def run_sync():
-            process_stdout = None
-            proc = None
-            try:
-                env = os.environ.copy()
-                env['RCLONE_CONFIG'] = self.rclone_config
-                
-                # Build command based on sync mode
-                if "Bidirectional" in sync_mode:
-                    self._maybe_clear_bisync_locks()
-                    cmd = [
-                        self.rclone_path,
-                        "bisync",
-                        remote,
-                        local_path,
-                        "--workdir",
-                        self.bisync_workdir,
-                        "--create-empty-src-dirs",
-                        "--resilient",
-                        "-v"
-                    ]
-                elif "Cloud to Local" in sync_mode:
-                    cmd = [
-                        self.rclone_path,
-                        "copy",
-                        remote,
-                        local_path,
-                        "-v"
-                    ]
-                else:  # Local to Cloud
-                    cmd = [
-                        self.rclone_path,
-                        "copy",
-                        local_path,
-                        remote,
-                        "-v"
-                    ]
-                
-                # Add bandwidth limit if specified
-                bandwidth = self.bw_entry.get().strip()
-                if bandwidth:
-                    cmd.extend(["--bwlimit", bandwidth])
-                    self.after(0, lambda: self.log(f"   Bandwidth limit: {bandwidth}"))
-                
-                # Add dry run flag
-                if self.dry_run:
-                    cmd.append("--dry-run")
-                
-                # Add exclude patterns
-                exclude_text = self.exclude_text.get("1.0", "end").strip()
-                if exclude_text:
-                    for pattern in exclude_text.split('\n'):
-                        pattern = pattern.strip()
-                        if pattern and not pattern.startswith('#'):
-                            cmd.extend(["--exclude", pattern])
-                
-                # Add additional flags
-                additional_flags = self.additional_flags_entry.get().strip()
-                if additional_flags:
-                    flag_parts = additional_flags.split()
-                    if "Bidirectional" in sync_mode:
-                        filtered = []
-                        for flag in flag_parts:
-                            if flag in ("--compare", "--slow-hash-sync-only"):
-                                self.after(0, lambda f=flag: self.log(f"⚠ Removed unsupported flag for bisync: {f}", "WARNING"))
-                                continue
-                            filtered.append(flag)
-                        flag_parts = filtered
-                    cmd.extend(flag_parts)
-                
-                self.after(0, lambda: self.log(f"   Command: {' '.join(cmd[2:])}"))
-                self.after(0, lambda: self.log(""))
-                
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    env=env,
-                    bufsize=1
-                )
-                self.sync_process = proc
+        cmd = self._build_sync_command(remote, local_path, sync_mode, extra_flags)
+        self.log(f"   Command: {shlex.join(cmd[2:])}")
+        self.log("")
+        
+        self._submit_sync_job(self._sync_coro(cmd))
+    
+    def _build_sync_command(self, remote: str, local_path: str, sync_mode: str,
+                            extra_flags: List[str]) -> List[str]:
+        """Build the rclone command line for the selected sync mode."""
+        if "Bidirectional" in sync_mode:
+            cmd = [self.rclone_path, "bisync", remote, local_path,
+                   "--workdir", self.bisync_workdir, *_BISYNC_FLAGS]
+        elif "Cloud to Local" in sync_mode:
+            cmd = [self.rclone_path, "copy", remote, local_path, *_COPY_FLAGS]
+        else:  # Local to Cloud
+            cmd = [self.rclone_path, "copy", local_path, remote, *_COPY_FLAGS]
+        
+        extras: List[str] = []
+        
+        # Add bandwidth limit if specified
+        bandwidth = self.bw_entry.get().strip()
+        if bandwidth:
+            extras += ("--bwlimit", bandwidth)
+            self.log(f"   Bandwidth limit: {bandwidth}")
+        
+        # Add dry run flag
+        if self.dry_run:
+            extras.append("--dry-run")
+        
+        # Add exclude patterns
+        extras += self._build_exclude_flags()
+        
+        # Scale parallelism with the CPUs we may run on, never below rclone's
+        # defaults, unless the user set it in the additional flags
+        ncpu = len(os.sched_getaffinity(0))
+        for flag, value in (
+            ("--transfers", max(4, min(16, ncpu * 2))),
+            ("--checkers", max(8, min(32, ncpu * 4))),
+        ):
+            if not any(f == flag or f.startswith(flag + "=") for f in extra_flags):
+                extras += (flag, str(value))
+        extras.append("--use-mmap")
+        
+        # Add additional flags
+        if "Bidirectional" in sync_mode:
+            for flag in extra_flags:
+                if flag in _BISYNC_DENY:
+                    self.log(f"⚠ Removed unsupported flag for bisync: {flag}", "WARNING")
+            extra_flags = [flag for flag in extra_flags if flag not in _BISYNC_DENY]
+        extras += extra_flags
+        
+        cmd.extend(extras)
+        return cmd
+    
+    async def _sync_coro(self, cmd: List[str]):
+        """Run an rclone sync command and stream its output into the log."""
+        try:
+            proc, output = await self._spawn_rclone(cmd)
 
-                if not self.is_syncing:
-                    self.after(0, lambda: self.log("⏹ Sync stopped by user"))
-                    self._terminate_sync_process()
-                    return
-                
-                process_stdout = proc.stdout
-                
-                # Read output with timeout check
-                timeout_time = time.time() + self.SYNC_TIMEOUT
-                for line in iter(proc.stdout.readline, ''):
-                    if not self.is_syncing:
-                        self.after(0, lambda: self.log("⏹ Sync stopped by user"))
-                        self._terminate_sync_process()
-                        break
-                    
-                    if time.time() > timeout_time:
-                        self.after(0, lambda: self.log(f"⏱️ Sync timeout ({self.SYNC_TIMEOUT // 60} min)", "WARNING"))
-                        self.is_syncing = False
-                        break
-                    
-                    line_clean = line.rstrip()
-                    if line_clean:
-                        self.after(0, lambda msg=line_clean: self.log(msg))
-                        
-                        # Update progress bar based on output
-                        if "Transferred:" in line_clean:
-                            self.after(0, lambda: self.progress_bar.set(0.7))
-                
-                proc.wait(timeout=10)
-                
-                if self.is_syncing:
-                    elapsed = int(time.time() - self.sync_start_time)
-                    self.after(0, lambda: self.progress_bar.set(1.0))
-                    
-                    if proc.returncode == 0:
-                        self.after(0, lambda: self.log(f"✓ Sync completed in {elapsed}s"))
-                    elif proc.returncode == 2:
-                        self.after(0, lambda: self.log(""))
-                        self.after(0, lambda: self.log("⚠ Bisync requires initialization", "WARNING"))
-                        self.after(0, lambda: self.log("   Click 'Force Resync' button to fix"))
-                    else:
-                        self.after(0, lambda: self.log(f"⚠ Exit code: {proc.returncode}", "WARNING"))
-                
-            except subprocess.TimeoutExpired:
-                self.after(0, lambda: self.log("❌ Sync timeout", "ERROR"))
-            except Exception as e:
-                self.after(0, lambda err=str(e): self.log(f"❌ Error: {err}", "ERROR"))
-            finally:
-                if process_stdout:
-                    try:
-                        process_stdout.close()
-                    except:
-                        pass
-                self.sync_process = None
-                
-                def reset_ui():
-                    self.is_syncing = False
-                    self.sync_btn.configure(state="normal")
-                    self.stop_btn.configure(state="disabled")
-                    self.status_indicator.configure(text="● Ready", text_color="#4ade80")
-                    self.progress_bar.set(0)
+            if self._stop_event.is_set():
+                self.log("⏹ Sync stopped by user")
+                await self._terminate_process(proc)
+                return
+            
+            outcome = await self._stream_to_log(proc, output, timeout=self.SYNC_TIMEOUT)
+            if outcome == "timeout":
+                self.log(f"⏱️ Sync timeout ({self.SYNC_TIMEOUT // 60} min)", "WARNING")
+                self.is_syncing = False
+            elif outcome == "stopped":
+                self.log("⏹ Sync stopped by user")
+            
+            await asyncio.wait_for(proc.wait(), timeout=10)
+            
+            if outcome == "done":
+                elapsed = int(time.time() - self.sync_start_time)
+                self.progress_bar.set(1.0)
                 
-                self.after(0, reset_ui)
-        
-        threading.Thread(target=run_sync, daemon=True).start()
+                if proc.returncode == 0:
+                    self.log(f"✓ Sync completed in {elapsed}s")
+                elif proc.returncode == 2:
+                    self.log("")
+                    self.log("⚠ Bisync requires initialization", "WARNING")
+                    self.log("   Click 'Force Resync' button to fix")
+                else:
+                    self.log(f"⚠ Exit code: {proc.returncode}", "WARNING")
+            
+        except asyncio.TimeoutError:
+            self.log("❌ Sync timeout", "ERROR")
+        except Exception as e:
+            self.log(f"❌ Error: {e}", "ERROR")
+        finally:
+            self.is_syncing = False
+            self.sync_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+            self.status_indicator.configure(text="● Ready", text_color="#4ade80")
+            self.progress_bar.set(0)
+            self._set_log_writable(False)
     
     def stop_sync(self):
         """Stop the running sync process."""
-        if self.sync_process and self.is_syncing:
+        if self.is_syncing:
             self.log("⏹ Stopping sync...")
             self.is_syncing = False
             try:
-                self._terminate_sync_process()
+                self._stop_event.set()
                 self.log("✓ Sync stopped")
             except Exception as e:
                 self.log(f"❌ Error stopping: {str(e)}", "ERROR")
@@ -1071,12 +1289,20 @@ class LinuxCloudSync(ctk.CTk):
             "additional_flags": self.additional_flags_entry.get().strip()
         }
         
-        if save_sync_profile(profile_name, profile):
-            self.log(f"✓ Profile '{profile_name}' saved")
-            self.sync_profiles = load_sync_profiles()
-            self.refresh_profiles_list()
-        else:
+        self._submit_io(
+            save_sync_profile, profile_name, profile,
+            callback=lambda ok: self._on_profile_saved(profile_name, profile, ok)
+        )
+    
+    def _on_profile_saved(self, profile_name: str, profile: Dict, ok: bool):
+        """Show the result of a background profile save."""
+        if not ok:
             self.log(f"❌ Failed to save profile", "ERROR")
+            return
+        
+        self.log(f"✓ Profile '{profile_name}' saved")
+        self.sync_profiles[profile_name] = profile
+        self.refresh_profiles_list()
     
     def load_profile(self, profile_name: str):
         """Load a saved sync profile."""
@@ -1109,6 +1335,9 @@ class LinuxCloudSync(ctk.CTk):
         self.additional_flags_entry.insert(0, profile.get("additional_flags", ""))
         
         self.current_profile = profile_name
+        if profile_name != self._last_profile:
+            self._last_profile = profile_name
+            self._io_executor.submit(save_last_profile_name, profile_name)
         self.log(f"✓ Loaded profile: {profile_name}")
         
         # Switch to Sync tab
@@ -1121,89 +1350,138 @@ class LinuxCloudSync(ctk.CTk):
             f"Delete profile '{profile_name}'?"
         )
         
-        if confirm and delete_sync_profile(profile_name):
-            self.log(f"✓ Profile '{profile_name}' deleted")
-            self.sync_profiles = load_sync_profiles()
-            self.refresh_profiles_list()
+        if not confirm:
+            return
+        
+        self._submit_io(
+            delete_sync_profile, profile_name,
+            callback=lambda ok: self._on_profile_deleted(profile_name, ok)
+        )
+    
+    def _on_profile_deleted(self, profile_name: str, ok: bool):
+        """Show the result of a background profile delete."""
+        if not ok:
+            return
+        
+        self.log(f"✓ Profile '{profile_name}' deleted")
+        self.sync_profiles.pop(profile_name, None)
+        self.refresh_profiles_list()
+    
+    def _on_profiles_loaded(self, result: tuple):
+        """Show the profiles read at startup and restore the last used one."""
+        self.sync_profiles, self._last_profile = result
+        self.refresh_profiles_list()
+        self.load_last_profile()
     
     def refresh_profiles_list(self):
-        """Refresh the profiles list display."""
-        # Clear existing widgets
-        for widget in self.profiles_frame.winfo_children():
-            widget.destroy()
+        """Refresh the profiles list display, touching only changed rows."""
+        for profile_name in self._profile_widgets.keys() - self.sync_profiles.keys():
+            self._profile_widgets.pop(profile_name)[0].destroy()
         
-        if not self.sync_profiles:
-            ctk.CTkLabel(
+        for profile_name, profile in self.sync_profiles.items():
+            remote_text = f"Remote: {profile.get('remote', 'N/A')}"
+            local_text = f"Local: {profile.get('local_path', 'N/A')}"
+            row = self._profile_widgets.get(profile_name)
+            if row is None:
+                self._profile_widgets[profile_name] = self._create_profile_row(
+                    profile_name, remote_text, local_text
+                )
+                continue
+            
+            _, remote_label, local_label = row
+            if remote_label.cget("text") != remote_text:
+                remote_label.configure(text=remote_text)
+            if local_label.cget("text") != local_text:
+                local_label.configure(text=local_text)
+        
+        if self.sync_profiles:
+            if self._profiles_empty_label is not None:
+                self._profiles_empty_label.destroy()
+                self._profiles_empty_label = None
+        elif self._profiles_empty_label is None:
+            self._profiles_empty_label = ctk.CTkLabel(
                 self.profiles_frame,
                 text="No saved profiles yet.\nCreate one from the Sync tab!",
-                font=ctk.CTkFont(size=14)
-            ).pack(pady=20)
-            return
+                font=self._fonts["body"]
+            )
+            self._profiles_empty_label.pack(pady=20)
+    
+    def _create_profile_row(self, profile_name: str, remote_text: str, local_text: str) -> tuple:
+        """Build one row of the profiles list; returns (frame, remote label, local label)."""
+        profile_frame = ctk.CTkFrame(self.profiles_frame)
+        profile_frame.pack(fill="x", padx=10, pady=5)
         
-        for profile_name, profile in self.sync_profiles.items():
-            profile_frame = ctk.CTkFrame(self.profiles_frame)
-            profile_frame.pack(fill="x", padx=10, pady=5)
-            
-            info_frame = ctk.CTkFrame(profile_frame, fg_color="transparent")
-            info_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=profile_name,
-                font=ctk.CTkFont(size=14, weight="bold")
-            ).pack(anchor="w")
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=f"Remote: {profile.get('remote', 'N/A')}",
-                font=ctk.CTkFont(size=11)
-            ).pack(anchor="w")
-            
-            ctk.CTkLabel(
-                info_frame,
-                text=f"Local: {profile.get('local_path', 'N/A')}",
-                font=ctk.CTkFont(size=11)
-            ).pack(anchor="w")
-            
-            btn_frame = ctk.CTkFrame(profile_frame, fg_color="transparent")
-            btn_frame.pack(side="right", padx=10)
-            
-            ctk.CTkButton(
-                btn_frame,
-                text="Load",
-                command=lambda p=profile_name: self.load_profile(p),
-                width=80
-            ).pack(side="left", padx=5)
-            
-            ctk.CTkButton(
-                btn_frame,
-                text="Delete",
-                command=lambda p=profile_name: self.delete_profile(p),
-                width=80,
-                fg_color="#ef4444"
-            ).pack(side="left", padx=5)
+        info_frame = ctk.CTkFrame(profile_frame, fg_color="transparent")
+        info_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        
+        ctk.CTkLabel(
+            info_frame,
+            text=profile_name,
+            font=self._fonts["h3"]
+        ).pack(anchor="w")
+        
+        remote_label = ctk.CTkLabel(
+            info_frame,
+            text=remote_text,
+            font=self._fonts["small"]
+        )
+        remote_label.pack(anchor="w")
+        
+        local_label = ctk.CTkLabel(
+            info_frame,
+            text=local_text,
+            font=self._fonts["small"]
+        )
+        local_label.pack(anchor="w")
+        
+        btn_frame = ctk.CTkFrame(profile_frame, fg_color="transparent")
+        btn_frame.pack(side="right", padx=10)
+        
+        ctk.CTkButton(
+            btn_frame,
+            text="Load",
+            command=lambda p=profile_name: self.load_profile(p),
+            width=80
+        ).pack(side="left", padx=5)
+        
+        ctk.CTkButton(
+            btn_frame,
+            text="Delete",
+            command=lambda p=profile_name: self.delete_profile(p),
+            width=80,
+            fg_color="#ef4444"
+        ).pack(side="left", padx=5)
+        
+        return profile_frame, remote_label, local_label
     
     def load_last_profile(self):
         """Load the last used profile if exists."""
-        config_file = get_config_dir() / "last_profile.txt"
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    last_profile = f.read().strip()
-                    if last_profile in self.sync_profiles:
-                        self.load_profile(last_profile)
-            except Exception as e:
-                self.logger.error(f"Error loading last profile: {e}")
+        if self._last_profile in self.sync_profiles:
+            self.load_profile(self._last_profile)
+    
+    def _open_in_file_manager(self, path: Path):
+        """Launch xdg-open for path, detached from the app.
+        
+        Popen does not wait for the child, so this runs directly rather than
+        queueing behind connect wizards on the workers.
+        """
+        try:
+            subprocess.Popen(
+                ["xdg-open", str(path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except Exception as e:
+            self.log(f"❌ Could not open {path}: {e}", "ERROR")
     
     def open_log_folder(self):
         """Open the log folder in file manager."""
-        log_dir = get_config_dir() / "logs"
-        subprocess.Popen(["xdg-open", str(log_dir)])
+        self._open_in_file_manager(get_config_dir() / "logs")
     
     def open_config_folder(self):
         """Open the config folder in file manager."""
-        config_dir = get_config_dir()
-        subprocess.Popen(["xdg-open", str(config_dir)])
+        self._open_in_file_manager(get_config_dir())
 
 
 def main():
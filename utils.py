@@ -5,9 +5,13 @@ utils.py - Enhanced utilities for LinuxCloud Sync
 import sys
 import os
 import logging
+import logging.handlers
 import json
+import queue
+import atexit
+import functools
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
 
 def resource_path(relative_path: str) -> str:
@@ -29,16 +33,19 @@ def ensure_executable(path: str) -> None:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Binary not found: {path}")
     
+    if os.access(path, os.X_OK):
+        return
+    
     try:
         os.chmod(path, 0o755)
         print(f"✓ Set executable permissions: {path}")
     except (PermissionError, OSError) as e:
-        if not os.access(path, os.X_OK):
-            raise PermissionError(f"Cannot execute {path}: {e}")
+        raise PermissionError(f"Cannot execute {path}: {e}")
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_dir() -> Path:
-    """Get the user's config directory."""
+    """Get the user's config directory, creating it on first use."""
     xdg_config = os.environ.get('XDG_CONFIG_HOME')
     
     if xdg_config:
@@ -62,21 +69,25 @@ def get_rclone_config_path() -> str:
 
 
 def setup_logging() -> logging.Logger:
-    """Setup application logging."""
-    log_dir = get_config_dir() / 'logs'
-    log_dir.mkdir(exist_ok=True)
-    
-    log_file = log_dir / 'linuxcloudsync.log'
+    """Setup application logging.
     
+    Records are handed to a QueueListener thread, so callers never block on
+    the log file; the listener is stopped (and flushed) at exit.
+    """
     logger = logging.getLogger('LinuxCloudSync')
     logger.setLevel(logging.INFO)
     
     if logger.handlers:
         return logger
     
+    log_dir = get_config_dir() / 'logs'
+    log_dir.mkdir(exist_ok=True)
+    
+    log_file = log_dir / 'linuxcloudsync.log'
+    handlers = []
+    
     try:
-        from logging.handlers import RotatingFileHandler
-        file_handler = RotatingFileHandler(
+        file_handler = logging.handlers.RotatingFileHandler(
             log_file,
             maxBytes=5*1024*1024,
             backupCount=3
@@ -86,7 +97,7 @@ def setup_logging() -> logging.Logger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         print(f"⚠ Warning: Could not setup file logging: {e}")
     
@@ -94,25 +105,133 @@ def setup_logging() -> logging.Logger:
     console_handler.setLevel(logging.WARNING)
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
 
+# Profiles are stored as an append-only log of {"op", "name", "data"} records.
+# The log is rewritten with one record per profile once it grows past
+# PROFILE_COMPACT_FACTOR times the number of live profiles.
+PROFILE_COMPACT_FACTOR = 4
+
+# Replayed profiles keyed by log path, reused until the file's mtime changes
+_PROFILE_CACHE: Dict[str, Dict] = {}
+_PROFILE_MTIME: Dict[str, int] = {}
+
+
+def _get_profiles_log() -> Path:
+    """Get the profiles log, migrating a legacy profiles.json on first use."""
+    config_dir = get_config_dir()
+    profiles_log = config_dir / 'profiles.jsonl'
+    legacy_file = config_dir / 'profiles.json'
+    
+    if not profiles_log.exists() and legacy_file.exists():
+        with open(legacy_file, 'r') as f:
+            _write_profiles(profiles_log, json.load(f))
+    
+    return profiles_log
+
+
+def _replay_profiles(profiles_log: Path) -> Tuple[Dict, int]:
+    """Replay the profiles log into a dict; also return the record count."""
+    profiles = {}
+    records = 0
+    with open(profiles_log, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # blank line or a write torn by a crash
+            if not isinstance(record, dict):
+                continue
+            records += 1
+            try:
+                if record.get("op") == "set":
+                    profiles[record["name"]] = record["data"]
+                elif record.get("op") == "del":
+                    profiles.pop(record["name"], None)
+            except (KeyError, TypeError):
+                continue  # malformed record; keep the rest of the log
+    return profiles, records
+
+
+def _read_profiles(profiles_log: Path) -> Dict:
+    """Read the profiles log, reusing the cached replay if it is unchanged."""
+    key = str(profiles_log)
+    try:
+        mtime = profiles_log.stat().st_mtime_ns
+    except FileNotFoundError:
+        _PROFILE_CACHE.pop(key, None)
+        _PROFILE_MTIME.pop(key, None)
+        return {}
+    
+    if _PROFILE_MTIME.get(key) != mtime:
+        profiles, records = _replay_profiles(profiles_log)
+        _PROFILE_CACHE[key] = profiles
+        _PROFILE_MTIME[key] = mtime
+        if records > PROFILE_COMPACT_FACTOR * max(len(profiles), 1):
+            try:
+                _write_profiles(profiles_log, profiles)
+            except Exception as e:
+                # The replay is still good; compaction is retried on the next replay
+                print(f"Error compacting profiles: {e}")
+    
+    return dict(_PROFILE_CACHE[key])
+
+
+def _write_profiles(profiles_log: Path, profiles: Dict) -> None:
+    """Atomically rewrite the profiles log with one record per profile."""
+    tmp_file = profiles_log.with_suffix('.jsonl.tmp')
+    with open(tmp_file, 'w') as f:
+        for name, profile in profiles.items():
+            f.write(json.dumps({"op": "set", "name": name, "data": profile}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, profiles_log)
+    
+    key = str(profiles_log)
+    _PROFILE_CACHE[key] = dict(profiles)
+    _PROFILE_MTIME[key] = profiles_log.stat().st_mtime_ns
+
+
+def _append_profile_record(profiles_log: Path, record: Dict) -> None:
+    """Durably append one record to the profiles log.
+    
+    If a crash left the last line without its newline, one is written first
+    so the new record does not get glued onto the torn one.
+    """
+    data = (json.dumps(record) + "\n").encode()
+    with open(profiles_log, 'ab+') as f:
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def save_sync_profile(name: str, profile: Dict) -> bool:
     """Save a sync profile."""
     try:
-        profiles_file = get_config_dir() / 'profiles.json'
+        profiles_log = _get_profiles_log()
         
-        profiles = {}
-        if profiles_file.exists():
-            with open(profiles_file, 'r') as f:
-                profiles = json.load(f)
+        profiles = _read_profiles(profiles_log)
+        _append_profile_record(profiles_log, {"op": "set", "name": name, "data": profile})
         
         profiles[name] = profile
-        
-        with open(profiles_file, 'w') as f:
-            json.dump(profiles, f, indent=2)
+        key = str(profiles_log)
+        _PROFILE_CACHE[key] = profiles
+        _PROFILE_MTIME[key] = profiles_log.stat().st_mtime_ns
         
         return True
     except Exception as e:
@@ -123,13 +242,7 @@ def save_sync_profile(name: str, profile: Dict) -> bool:
 def load_sync_profiles() -> Dict:
     """Load all sync profiles."""
     try:
-        profiles_file = get_config_dir() / 'profiles.json'
-        
-        if profiles_file.exists():
-            with open(profiles_file, 'r') as f:
-                return json.load(f)
-        
-        return {}
+        return _read_profiles(_get_profiles_log())
     except Exception as e:
         print(f"Error loading profiles: {e}")
         return {}
@@ -138,20 +251,17 @@ def load_sync_profiles() -> Dict:
 def delete_sync_profile(name: str) -> bool:
     """Delete a sync profile."""
     try:
-        profiles_file = get_config_dir() / 'profiles.json'
-        
-        if not profiles_file.exists():
-            return False
+        profiles_log = _get_profiles_log()
         
-        with open(profiles_file, 'r') as f:
-            profiles = json.load(f)
+        profiles = _read_profiles(profiles_log)
         
         if name in profiles:
-            del profiles[name]
-            
-            with open(profiles_file, 'w') as f:
-                json.dump(profiles, f, indent=2)
+            _append_profile_record(profiles_log, {"op": "del", "name": name})
             
+            del profiles[name]
+            key = str(profiles_log)
+            _PROFILE_CACHE[key] = profiles
+            _PROFILE_MTIME[key] = profiles_log.stat().st_mtime_ns
             return True
         
         return False
@@ -160,6 +270,34 @@ def delete_sync_profile(name: str) -> bool:
         return False
 
 
+def load_last_profile_name() -> Optional[str]:
+    """Load the name of the last used profile, if any."""
+    try:
+        return (get_config_dir() / 'last_profile.txt').read_text().strip() or None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading last profile: {e}")
+        return None
+
+
+def save_last_profile_name(name: str) -> bool:
+    """Save the name of the last used profile, replacing the file atomically."""
+    try:
+        last_file = get_config_dir() / 'last_profile.txt'
+        tmp_file = last_file.with_suffix('.txt.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(name)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, last_file)
+        return True
+    except Exception as e:
+        print(f"Error saving last profile: {e}")
+        return False
+
+
+@functools.cache
 def get_app_version() -> str:
     """Get the application version from .build_version if present."""
     try: